@@ -1,8 +1,11 @@
 # Copyright (c) 2022 Kyle Schouviller (https://github.com/kyle0654)
 
 from logging import Logger
+from typing import cast
 
 from invokeai.app.services.item_storage.item_storage_memory import ItemStorageMemory
+from invokeai.app.services.shared.lazy_service import LazyService
+from invokeai.app.services.shared.sqlite.sqlite_database import SqliteDatabase
 from invokeai.app.services.shared.sqlite.sqlite_util import init_db
 from invokeai.backend.model_manager.metadata import ModelMetadataStore
 from invokeai.backend.util.logging import InvokeAILogger
@@ -60,6 +63,7 @@ class ApiDependencies:
     """Contains and initializes all dependencies for the API"""
 
     invoker: Invoker
+    db: SqliteDatabase
 
     @staticmethod
     def initialize(config: InvokeAIAppConfig, event_handler_id: int, logger: Logger = logger) -> None:
@@ -68,7 +72,8 @@ class ApiDependencies:
         logger.debug(f"Internet connectivity is {config.internet_available}")
 
         output_folder = config.output_path
-        image_files = DiskImageFileStorage(f"{output_folder}/images")
+        assert output_folder is not None
+        image_files = DiskImageFileStorage(output_folder / "images")
 
         db = init_db(config=config, logger=logger, image_files=image_files)
 
@@ -84,8 +89,10 @@ class ApiDependencies:
         image_records = SqliteImageRecordStorage(db=db)
         images = ImageService()
         invocation_cache = MemoryInvocationCache(max_cache_size=config.node_cache_size)
-        latents = ForwardCacheLatentsStorage(DiskLatentsStorage(f"{output_folder}/latents"))
-        model_manager = ModelManagerService(config, logger)
+        latents = ForwardCacheLatentsStorage(DiskLatentsStorage(output_folder / "latents"))
+        # The model manager reads the models config and probes devices on construction, but isn't needed until the
+        # first model-related request. Defer constructing it so the server can start accepting requests sooner.
+        model_manager = cast(ModelManagerService, LazyService(ModelManagerService, config, logger))
         model_record_service = ModelRecordServiceSQL(db=db)
         download_queue_service = DownloadQueueService(event_bus=events)
         metadata_store = ModelMetadataStore(db=db)
@@ -134,9 +141,13 @@ class ApiDependencies:
         )
 
         ApiDependencies.invoker = Invoker(services)
+        ApiDependencies.db = db
         db.clean()
 
     @staticmethod
     def shutdown() -> None:
         if ApiDependencies.invoker:
             ApiDependencies.invoker.stop()
+        if ApiDependencies.db:
+            # Checkpoints the WAL file, so the database file alone holds every commit
+            ApiDependencies.db.close()
@@ -1,7 +1,6 @@
 import io
 from typing import Literal, Optional
 
-import matplotlib.pyplot as plt
 import numpy as np
 import PIL.Image
 from easing_functions import (
@@ -37,7 +36,6 @@ from easing_functions import (
     SineEaseInOut,
     SineEaseOut,
 )
-from matplotlib.ticker import MaxNLocator
 
 from invokeai.app.invocations.primitives import FloatCollectionOutput
 
@@ -235,6 +233,10 @@ class StepParamEasingInvocation(BaseInvocation):
         param_list = prelist + easing_list + postlist
 
         if self.show_easing_plot:
+            # matplotlib is slow to import and only needed for this debug plot, so import it lazily
+            import matplotlib.pyplot as plt
+            from matplotlib.ticker import MaxNLocator
+
             plt.figure()
             plt.xlabel("Step")
             plt.ylabel("Param Value")
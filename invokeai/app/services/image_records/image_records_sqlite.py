@@ -28,28 +28,26 @@ class SqliteImageRecordStorage(ImageRecordStorageBase):
 
     def __init__(self, db: SqliteDatabase) -> None:
         super().__init__()
+        self._db = db
         self._lock = db.lock
         self._conn = db.conn
         self._cursor = self._conn.cursor()
 
     def get(self, image_name: str) -> ImageRecord:
         try:
-            self._lock.acquire()
-
-            self._cursor.execute(
-                f"""--sql
-                SELECT {IMAGE_DTO_COLS} FROM images
-                WHERE image_name = ?;
-                """,
-                (image_name,),
-            )
+            with self._db.reader() as conn:
+                cursor = conn.cursor()
+                cursor.execute(
+                    f"""--sql
+                    SELECT {IMAGE_DTO_COLS} FROM images
+                    WHERE image_name = ?;
+                    """,
+                    (image_name,),
+                )
 
-            result = cast(Optional[sqlite3.Row], self._cursor.fetchone())
+                result = cast(Optional[sqlite3.Row], cursor.fetchone())
         except sqlite3.Error as e:
-            self._conn.rollback()
             raise ImageRecordNotFoundException from e
-        finally:
-            self._lock.release()
 
         if not result:
             raise ImageRecordNotFoundException
@@ -58,29 +56,26 @@ class SqliteImageRecordStorage(ImageRecordStorageBase):
 
     def get_metadata(self, image_name: str) -> Optional[MetadataField]:
         try:
-            self._lock.acquire()
-
-            self._cursor.execute(
-                """--sql
-                SELECT metadata FROM images
-                WHERE image_name = ?;
-                """,
-                (image_name,),
-            )
-
-            result = cast(Optional[sqlite3.Row], self._cursor.fetchone())
-
-            if not result:
-                raise ImageRecordNotFoundException
+            with self._db.reader() as conn:
+                cursor = conn.cursor()
+                cursor.execute(
+                    """--sql
+                    SELECT metadata FROM images
+                    WHERE image_name = ?;
+                    """,
+                    (image_name,),
+                )
 
-            as_dict = dict(result)
-            metadata_raw = cast(Optional[str], as_dict.get("metadata", None))
-            return MetadataFieldValidator.validate_json(metadata_raw) if metadata_raw is not None else None
+                result = cast(Optional[sqlite3.Row], cursor.fetchone())
         except sqlite3.Error as e:
-            self._conn.rollback()
             raise ImageRecordNotFoundException from e
-        finally:
-            self._lock.release()
+
+        if not result:
+            raise ImageRecordNotFoundException
+
+        as_dict = dict(result)
+        metadata_raw = cast(Optional[str], as_dict.get("metadata", None))
+        return MetadataFieldValidator.validate_json(metadata_raw) if metadata_raw is not None else None
 
     def update(
         self,
@@ -150,8 +145,6 @@ class SqliteImageRecordStorage(ImageRecordStorageBase):
         board_id: Optional[str] = None,
     ) -> OffsetPaginatedResults[ImageRecord]:
         try:
-            self._lock.acquire()
-
             # Manually build two queries - one for the count, one for the records
             count_query = """--sql
             SELECT COUNT(*)
@@ -219,21 +212,23 @@ class SqliteImageRecordStorage(ImageRecordStorageBase):
             # Add the pagination parameters
             images_params.extend([limit, offset])
 
-            # Build the list of images, deserializing each row
-            self._cursor.execute(images_query, images_params)
-            result = cast(list[sqlite3.Row], self._cursor.fetchall())
-            images = [deserialize_image_record(dict(r)) for r in result]
+            # The page and the count are read in one block, so they come from the same snapshot of the database
+            with self._db.reader() as conn:
+                cursor = conn.cursor()
 
-            # Set up and execute the count query, without pagination
-            count_query += query_conditions + ";"
-            count_params = query_params.copy()
-            self._cursor.execute(count_query, count_params)
-            count = cast(int, self._cursor.fetchone()[0])
+                # Build the list of images, deserializing each row
+                cursor.execute(images_query, images_params)
+                result = cast(list[sqlite3.Row], cursor.fetchall())
+
+                # Set up and execute the count query, without pagination
+                count_query += query_conditions + ";"
+                count_params = query_params.copy()
+                cursor.execute(count_query, count_params)
+                count = cast(int, cursor.fetchone()[0])
         except sqlite3.Error as e:
-            self._conn.rollback()
             raise e
-        finally:
-            self._lock.release()
+
+        images = [deserialize_image_record(dict(r)) for r in result]
 
         return OffsetPaginatedResults(items=images, offset=offset, limit=limit, total=count)
 
@@ -385,9 +380,9 @@ class SqliteImageRecordStorage(ImageRecordStorageBase):
             self._lock.release()
 
     def get_most_recent_image_for_board(self, board_id: str) -> Optional[ImageRecord]:
-        try:
-            self._lock.acquire()
-            self._cursor.execute(
+        with self._db.reader() as conn:
+            cursor = conn.cursor()
+            cursor.execute(
                 """--sql
                 SELECT images.*
                 FROM images
@@ -399,9 +394,7 @@ class SqliteImageRecordStorage(ImageRecordStorageBase):
                 (board_id,),
             )
 
-            result = cast(Optional[sqlite3.Row], self._cursor.fetchone())
-        finally:
-            self._lock.release()
+            result = cast(Optional[sqlite3.Row], cursor.fetchone())
         if result is None:
             return None
 
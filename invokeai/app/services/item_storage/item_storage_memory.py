@@ -28,17 +28,18 @@ class ItemStorageMemory(ItemStorageABC[T], Generic[T]):
 
     def get(self, item_id: str) -> T:
         # If the item exists, move it to the end of the OrderedDict.
-        item = self._items.pop(item_id, None)
-        if item is None:
-            raise ItemNotFoundError(item_id)
-        self._items[item_id] = item
+        try:
+            item = self._items[item_id]
+            self._items.move_to_end(item_id)
+        except KeyError:
+            raise ItemNotFoundError(item_id) from None
         return item
 
     def set(self, item: T) -> None:
         item_id = getattr(item, self._id_field)
         if item_id in self._items:
-            # If item already exists, remove it and add it to the end
-            self._items.pop(item_id)
+            # If item already exists, move it to the end before replacing it
+            self._items.move_to_end(item_id)
         elif len(self._items) >= self._max_items:
             # If cache is full, evict the least recently used item
             self._items.popitem(last=False)
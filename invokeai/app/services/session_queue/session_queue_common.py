@@ -425,7 +425,9 @@ ValuesToInsert: TypeAlias = list[SessionQueueValueToInsert]
 
 def prepare_values_to_insert(queue_id: str, batch: Batch, priority: int, max_new_queue_items: int) -> ValuesToInsert:
     values_to_insert: ValuesToInsert = []
-    for session, field_values, workflow in create_session_nfv_tuples(batch, max_new_queue_items):
+    # Every session in the batch shares the batch's workflow, so we only need to serialize it once
+    workflow_json = json.dumps(batch.workflow, default=to_jsonable_python) if batch.workflow else None
+    for session, field_values, _ in create_session_nfv_tuples(batch, max_new_queue_items):
         # sessions must have unique id
         session.id = uuid_string()
         values_to_insert.append(
@@ -437,7 +439,7 @@ def prepare_values_to_insert(queue_id: str, batch: Batch, priority: int, max_new
                 # must use pydantic_encoder bc field_values is a list of models
                 json.dumps(field_values, default=to_jsonable_python) if field_values else None,  # field_values (json)
                 priority,  # priority
-                json.dumps(workflow, default=to_jsonable_python) if workflow else None,  # workflow (json)
+                workflow_json,  # workflow (json)
             )
         )
     return values_to_insert
@@ -2,6 +2,7 @@
 
 import copy
 import itertools
+from functools import lru_cache
 from typing import Annotated, Any, Optional, Union, get_args, get_origin, get_type_hints
 
 import networkx as nx
@@ -47,16 +48,25 @@ class Edge(BaseModel):
     destination: EdgeConnection = Field(description="The connection for the edge's to node and field")
 
 
+@lru_cache(maxsize=None)
+def get_cached_type_hints(cls: type) -> dict[str, Any]:
+    """
+    Gets the type hints for a class, caching the result. Resolving type hints is expensive and is done for every
+    edge validated, but the hints for a given class never change. The returned dict must not be mutated.
+    """
+    return get_type_hints(cls)
+
+
 def get_output_field(node: BaseInvocation, field: str) -> Any:
     node_type = type(node)
-    node_outputs = get_type_hints(node_type.get_output_annotation())
+    node_outputs = get_cached_type_hints(node_type.get_output_annotation())
     node_output_field = node_outputs.get(field) or None
     return node_output_field
 
 
 def get_input_field(node: BaseInvocation, field: str) -> Any:
     node_type = type(node)
-    node_inputs = get_type_hints(node_type)
+    node_inputs = get_cached_type_hints(node_type)
     node_input_field = node_inputs.get(field) or None
     return node_input_field
 
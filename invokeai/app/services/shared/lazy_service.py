@@ -0,0 +1,57 @@
+import threading
+from typing import Any, Generic, Optional, TypeVar
+
+from invokeai.backend.util.logging import InvokeAILogger
+
+T = TypeVar("T")
+
+
+class LazyService(Generic[T]):
+    """
+    A proxy that defers constructing a service until one of its attributes is first accessed.
+
+    :param service_class: The class of the service to construct
+    :param args: Positional args for the service's constructor
+    :param kwargs: Keyword args for the service's constructor
+
+    Use this for services whose constructors do significant I/O but are not needed until after the app has started.
+    Services with `start()` or `stop()` methods are constructed when the invoker starts them, so only services without
+    lifecycle hooks actually benefit.
+
+    Errors raised by the service's constructor are logged and re-raised from the access that triggered construction.
+    Construction is retried on the next access.
+
+    Example:
+    ```py
+    model_manager = LazyService(ModelManagerService, config, logger)
+    model_manager.list_models()  # ModelManagerService is constructed here
+    ```
+    """
+
+    def __init__(self, service_class: type[T], *args: Any, **kwargs: Any) -> None:
+        self._service_class = service_class
+        self._args = args
+        self._kwargs = kwargs
+        self._service: Optional[T] = None
+        self._lock = threading.Lock()
+        self._logger = InvokeAILogger.get_logger(name=self.__class__.__name__)
+
+    def get_service(self) -> T:
+        """Gets the service, constructing it if it has not been constructed yet."""
+        if self._service is None:
+            with self._lock:
+                if self._service is None:
+                    try:
+                        self._service = self._service_class(*self._args, **self._kwargs)
+                    except Exception as e:
+                        # Construction happens on whichever thread first uses the service, so make the cause obvious
+                        self._logger.error(f"Failed to initialize {self._service_class.__name__}: {e}")
+                        raise
+        return self._service
+
+    def __getattr__(self, name: str) -> Any:
+        # The invoker probes every service for `start()` and `stop()`. Don't construct the service just to find out it
+        # doesn't have them.
+        if self._service is None and name in ("start", "stop") and not hasattr(self._service_class, name):
+            raise AttributeError(f"'{self._service_class.__name__}' object has no attribute '{name}'")
+        return getattr(self.get_service(), name)
@@ -1,7 +1,11 @@
+import os
 import sqlite3
 import threading
+from contextlib import contextmanager
 from logging import Logger
 from pathlib import Path
+from queue import Queue
+from typing import Iterator
 
 from invokeai.app.services.shared.sqlite.sqlite_common import sqlite_memory
 
@@ -17,12 +21,16 @@ class SqliteDatabase:
     This is a light wrapper around the `sqlite3` module, providing a few conveniences:
     - The database file is written to disk if it does not exist.
     - Foreign key constraints are enabled by default.
+    - File-backed databases use write-ahead logging with relaxed syncing where the filesystem supports it, reducing
+      fsyncs and lock contention.
     - The connection is configured to use the `sqlite3.Row` row factory.
 
     In addition to the constructor args, the instance provides the following attributes and methods:
     - `conn`: A `sqlite3.Connection` object. Note that the connection must never be closed if the database is in-memory.
     - `lock`: A shared re-entrant lock, used to approximate thread safety.
+    - `reader()`: A context manager providing a connection for read-only queries, which need not hold `lock`.
     - `clean()`: Runs the SQL `VACUUM;` command and reports on the freed space.
+    - `close()`: Closes all connections to the database.
     """
 
     def __init__(self, db_path: Path | None, logger: Logger, verbose: bool = False) -> None:
@@ -37,14 +45,75 @@ class SqliteDatabase:
             self.db_path.parent.mkdir(parents=True, exist_ok=True)
             self.logger.info(f"Initializing database at {self.db_path}")
 
-        self.conn = sqlite3.connect(database=self.db_path or sqlite_memory, check_same_thread=False)
+        self.conn = self._connect()
         self.lock = threading.RLock()
-        self.conn.row_factory = sqlite3.Row
+
+        self._is_wal = False
+        if self.db_path:
+            # WAL mode is persisted in the database file, so it only needs to be set once. SQLite reports the mode
+            # actually in effect, which may not be WAL (e.g. on some network filesystems).
+            journal_mode = self.conn.execute("PRAGMA journal_mode = WAL;").fetchone()[0]
+            self._is_wal = str(journal_mode).lower() == "wal"
+            if self._is_wal:
+                # NORMAL only syncs at checkpoints rather than on every commit. The database stays consistent, but the
+                # most recent commits may be rolled back after a power loss or OS crash. That is traded for fewer fsyncs.
+                self.conn.execute("PRAGMA synchronous = NORMAL;")
+            else:
+                self.logger.warning(f"Unable to enable WAL mode for database, using journal mode {journal_mode}")
+
+        # Under WAL, readers neither block nor are blocked by the writer, so reads get a pool of their own connections.
+        # Without WAL (including in-memory databases, which are private to their connection) there is no read pool.
+        self._read_pool: Queue[sqlite3.Connection] = Queue()
+        # Every read connection, including those checked out of the pool, so they can all be closed
+        self._read_conns: list[sqlite3.Connection] = []
+        if self._is_wal:
+            for _ in range(min(4, os.cpu_count() or 1)):
+                read_conn = self._connect()
+                read_conn.execute("PRAGMA query_only = ON;")
+                # Readers share the OS page cache, so they don't each need a large private cache (~4MB)
+                read_conn.execute("PRAGMA cache_size = -4000;")
+                self._read_conns.append(read_conn)
+                self._read_pool.put(read_conn)
+
+    def _connect(self) -> sqlite3.Connection:
+        """Opens a connection to the database and applies per-connection PRAGMAs."""
+        conn = sqlite3.connect(database=self.db_path or sqlite_memory, check_same_thread=False)
+        conn.row_factory = sqlite3.Row
 
         if self.verbose:
-            self.conn.set_trace_callback(self.logger.debug)
+            conn.set_trace_callback(self.logger.debug)
+
+        conn.execute("PRAGMA foreign_keys = ON;")
+        conn.execute("PRAGMA busy_timeout = 5000;")
+        conn.execute("PRAGMA temp_store = MEMORY;")
+        # A negative value sets the cache size in KiB rather than pages (~20MB)
+        conn.execute("PRAGMA cache_size = -20000;")
+        return conn
+
+    @contextmanager
+    def reader(self) -> Iterator[sqlite3.Connection]:
+        """
+        Provides a connection for read-only queries.
 
-        self.conn.execute("PRAGMA foreign_keys = ON;")
+        For file-backed databases in WAL mode, this is taken from a pool of read-only connections and the caller need not
+        hold `lock`. All queries in the block run in one read transaction, so they see the same snapshot of the database.
+        Otherwise, this is `conn`, and `lock` is held for the duration.
+        """
+        if not self._is_wal:
+            with self.lock:
+                yield self.conn
+            return
+
+        conn = self._read_pool.get()
+        try:
+            # sqlite3 doesn't open a transaction for SELECTs, so without this each query would read its own snapshot
+            conn.execute("BEGIN;")
+            try:
+                yield conn
+            finally:
+                conn.commit()
+        finally:
+            self._read_pool.put(conn)
 
     def clean(self) -> None:
         """
@@ -58,6 +127,10 @@ class SqliteDatabase:
                 initial_db_size = Path(self.db_path).stat().st_size
                 self.conn.execute("VACUUM;")
                 self.conn.commit()
+                if self._is_wal:
+                    # Under WAL, VACUUM writes the rebuilt database to the WAL file. The main file only shrinks once
+                    # it is checkpointed.
+                    self.conn.execute("PRAGMA wal_checkpoint(TRUNCATE);")
                 final_db_size = Path(self.db_path).stat().st_size
                 freed_space_in_mb = round((initial_db_size - final_db_size) / 1024 / 1024, 2)
                 if freed_space_in_mb > 0:
@@ -65,3 +138,13 @@ class SqliteDatabase:
             except Exception as e:
                 self.logger.error(f"Error cleaning database: {e}")
                 raise
+
+    def close(self) -> None:
+        """Closes the read connections and the main connection. The database may not be used afterwards."""
+        with self.lock:
+            for read_conn in self._read_conns:
+                read_conn.close()
+            if self._is_wal:
+                # Move all commits into the main database file, so it can be copied on its own
+                self.conn.execute("PRAGMA wal_checkpoint(TRUNCATE);")
+            self.conn.close()
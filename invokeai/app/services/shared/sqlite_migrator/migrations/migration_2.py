@@ -1,4 +1,6 @@
+import os
 import sqlite3
+from concurrent.futures import ThreadPoolExecutor
 from logging import Logger
 
 from pydantic import ValidationError
@@ -114,30 +116,44 @@ class Migration2Callback:
 
         self._logger.info(f"Migrating workflows for {total_image_names} images")
 
-        # Migrate the images
-        to_migrate: list[tuple[bool, str]] = []
-        pbar = tqdm(image_names)
-        for idx, image_name in enumerate(pbar):
-            pbar.set_description(f"Checking image {idx + 1}/{total_image_names} for workflow")
-            try:
-                pil_image = self._image_files.get(image_name)
-            except ImageFileNotFoundException:
-                self._logger.warning(f"Image {image_name} not found, skipping")
-                continue
-            except Exception as e:
-                self._logger.warning(f"Error while checking image {image_name}, skipping: {e}")
-                continue
-            if "invokeai_workflow" in pil_image.info:
-                try:
-                    UnsafeWorkflowWithVersionValidator.validate_json(pil_image.info.get("invokeai_workflow", ""))
-                except ValidationError:
-                    self._logger.warning(f"Image {image_name} has invalid embedded workflow, skipping")
-                    continue
-                to_migrate.append((True, image_name))
+        # Checking an image is I/O bound, so we can use a thread pool to speed things up. The database is only written
+        # to from this thread, after all images have been checked.
+        max_workers = min(32, (os.cpu_count() or 1) * 4)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            results = list(
+                tqdm(
+                    executor.map(self._image_has_workflow, image_names),
+                    total=total_image_names,
+                    desc="Checking images for workflows",
+                )
+            )
+
+        to_migrate: list[tuple[bool, str]] = [
+            (True, image_name) for image_name, has_workflow in zip(image_names, results, strict=True) if has_workflow
+        ]
 
         self._logger.info(f"Adding {len(to_migrate)} embedded workflows to database")
         cursor.executemany("UPDATE images SET has_workflow = ? WHERE image_name = ?", to_migrate)
 
+    def _image_has_workflow(self, image_name: str) -> bool:
+        """Checks if an image has a valid embedded workflow. Errors are logged and treated as no workflow."""
+        try:
+            pil_image = self._image_files.get(image_name)
+        except ImageFileNotFoundException:
+            self._logger.warning(f"Image {image_name} not found, skipping")
+            return False
+        except Exception as e:
+            self._logger.warning(f"Error while checking image {image_name}, skipping: {e}")
+            return False
+        if "invokeai_workflow" not in pil_image.info:
+            return False
+        try:
+            UnsafeWorkflowWithVersionValidator.validate_json(pil_image.info.get("invokeai_workflow", ""))
+        except ValidationError:
+            self._logger.warning(f"Image {image_name} has invalid embedded workflow, skipping")
+            return False
+        return True
+
 
 def build_migration_2(image_files: ImageFileStorageBase, logger: Logger) -> Migration:
     """
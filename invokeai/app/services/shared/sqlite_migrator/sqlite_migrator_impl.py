@@ -14,7 +14,8 @@ class SqliteMigrator:
 
     Migrations should be registered with :meth:`register_migration`.
 
-    Each migration is run in a transaction. If a migration fails, the transaction is rolled back.
+    All pending migrations are run in a single transaction. If any migration fails, the transaction is rolled back
+    and the database is left at the version it was at before migrating.
 
     Example Usage:
     ```py
@@ -55,38 +56,47 @@ class SqliteMigrator:
                 return False
 
             self._logger.info("Database update needed")
-            next_migration = self._migration_set.get(from_version=self._get_current_version(cursor))
-            while next_migration is not None:
-                self._run_migration(next_migration)
-                next_migration = self._migration_set.get(self._get_current_version(cursor))
+            try:
+                # Python's sqlite3 module does not open a transaction for DDL statements, so we must be explicit.
+                # IMMEDIATE takes the write lock up front, so we don't hit SQLITE_BUSY upgrading a read lock later.
+                cursor.execute("BEGIN IMMEDIATE;")
+                next_migration = self._migration_set.get(from_version=self._get_current_version(cursor))
+                while next_migration is not None:
+                    self._run_migration(next_migration)
+                    next_migration = self._migration_set.get(self._get_current_version(cursor))
+                self._db.conn.commit()
+            # We want to catch *any* error, mirroring the behaviour of the sqlite3 module.
+            except Exception:
+                self._db.conn.rollback()
+                raise
+            # Let SQLite refresh query planner statistics for any tables or indices the migrations changed. This only
+            # analyzes what needs it, so it's much cheaper than a full ANALYZE.
+            cursor.execute("PRAGMA optimize;")
             self._logger.info("Database updated successfully")
             return True
 
     def _run_migration(self, migration: Migration) -> None:
-        """Runs a single migration."""
+        """Runs a single migration. The caller is responsible for managing the transaction."""
         try:
-            # Using sqlite3.Connection as a context manager commits a the transaction on exit, or rolls it back if an
-            # exception is raised.
-            with self._db.lock, self._db.conn as conn:
-                cursor = conn.cursor()
-                if self._get_current_version(cursor) != migration.from_version:
-                    raise MigrationError(
-                        f"Database is at version {self._get_current_version(cursor)}, expected {migration.from_version}"
-                    )
-                self._logger.debug(f"Running migration from {migration.from_version} to {migration.to_version}")
-
-                # Run the actual migration
-                migration.callback(cursor)
-
-                # Update the version
-                cursor.execute("INSERT INTO migrations (version) VALUES (?);", (migration.to_version,))
-
-                self._logger.debug(
-                    f"Successfully migrated database from {migration.from_version} to {migration.to_version}"
+            cursor = self._db.conn.cursor()
+            if self._get_current_version(cursor) != migration.from_version:
+                raise MigrationError(
+                    f"Database is at version {self._get_current_version(cursor)}, expected {migration.from_version}"
                 )
+            self._logger.debug(f"Running migration from {migration.from_version} to {migration.to_version}")
+
+            # Run the actual migration
+            migration.callback(cursor)
+
+            # Update the version
+            cursor.execute("INSERT INTO migrations (version) VALUES (?);", (migration.to_version,))
+
+            self._logger.debug(
+                f"Successfully migrated database from {migration.from_version} to {migration.to_version}"
+            )
         # We want to catch *any* error, mirroring the behaviour of the sqlite3 module.
         except Exception as e:
-            # The connection context manager has already rolled back the migration, so we don't need to do anything.
+            # The transaction is rolled back by `run_migrations`, so we don't need to do anything here.
             msg = f"Error migrating database from {migration.from_version} to {migration.to_version}: {e}"
             self._logger.error(msg)
             raise MigrationError(msg) from e
@@ -1,4 +1,4 @@
-from enum import EnumMeta
+from enum import Enum, EnumMeta
 
 
 class MetaEnum(EnumMeta):
@@ -8,6 +8,17 @@ class MetaEnum(EnumMeta):
     """
 
     def __contains__(cls, item):
+        # Fast path: look the value up directly, avoiding constructing an enum member (and raising on a miss)
+        try:
+            if item in cls._value2member_map_:
+                return True
+        except TypeError:
+            # Unhashable values can't be in the map, but `_missing_` may still accept them
+            pass
+        else:
+            # Without a custom `_missing_`, a value not in the map is not a member
+            if cls._missing_.__func__ is Enum._missing_.__func__:
+                return False
         try:
             cls(item)
         except ValueError:
@@ -152,7 +152,14 @@ class DatabaseMapper:
             print("Done!")
         database_backup_path = os.path.join(self.database_backup_dir, f"backup-{timestamp_string}-invokeai.db")
         print(f"Making DB Backup at {database_backup_path}...", end="")
-        shutil.copy2(self.database_path, database_backup_path)
+        # Use SQLite's backup API rather than copying the file, so that commits still in the WAL file are included
+        source = sqlite3.connect(self.database_path)
+        destination = sqlite3.connect(database_backup_path)
+        try:
+            source.backup(destination)
+        finally:
+            destination.close()
+            source.close()
         print("Done!")
 
     def connect(self):
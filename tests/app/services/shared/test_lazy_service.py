@@ -0,0 +1,61 @@
+import pytest
+
+from invokeai.app.services.shared.lazy_service import LazyService
+
+
+class MockService:
+    instances = 0
+
+    def __init__(self, value: int) -> None:
+        MockService.instances += 1
+        self.value = value
+
+    def get_value(self) -> int:
+        return self.value
+
+
+class MockServiceThatFailsOnce(MockService):
+    def __init__(self, value: int) -> None:
+        super().__init__(value)
+        if MockService.instances == 1:
+            raise RuntimeError("failed to initialize")
+
+
+class MockServiceWithStart(MockService):
+    def start(self, invoker) -> None:
+        self.started = True
+
+
+@pytest.fixture(autouse=True)
+def reset_instances():
+    MockService.instances = 0
+
+
+def test_lazy_service_defers_construction():
+    lazy = LazyService(MockService, 42)
+    assert MockService.instances == 0
+    assert lazy.get_value() == 42
+    assert lazy.value == 42
+    assert MockService.instances == 1
+
+
+def test_lazy_service_does_not_construct_for_missing_lifecycle_hooks():
+    lazy = LazyService(MockService, 42)
+    assert getattr(lazy, "start", None) is None
+    assert getattr(lazy, "stop", None) is None
+    assert MockService.instances == 0
+
+
+def test_lazy_service_constructs_for_lifecycle_hooks():
+    lazy = LazyService(MockServiceWithStart, 42)
+    lazy.start(None)
+    assert MockService.instances == 1
+    assert lazy.started is True
+
+
+def test_lazy_service_propagates_constructor_errors_and_retries():
+    lazy = LazyService(MockServiceThatFailsOnce, 42)
+    with pytest.raises(RuntimeError, match="failed to initialize"):
+        lazy.get_value()
+    assert lazy.get_value() == 42
+    assert MockService.instances == 2
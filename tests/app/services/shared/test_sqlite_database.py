@@ -0,0 +1,62 @@
+import sqlite3
+from logging import Logger
+from pathlib import Path
+from tempfile import TemporaryDirectory
+
+import pytest
+
+from invokeai.app.services.shared.sqlite.sqlite_database import SqliteDatabase
+
+
+@pytest.fixture
+def logger() -> Logger:
+    return Logger("test_sqlite_database")
+
+
+def test_reader_uses_main_connection_for_memory_db(logger: Logger):
+    db = SqliteDatabase(db_path=None, logger=logger)
+    with db.reader() as conn:
+        assert conn is db.conn
+
+
+def test_reader_sees_committed_writes_only(logger: Logger):
+    with TemporaryDirectory() as tempdir:
+        db = SqliteDatabase(db_path=Path(tempdir) / "invokeai.db", logger=logger)
+        db.conn.execute("CREATE TABLE test (id INTEGER PRIMARY KEY);")
+        db.conn.commit()
+        db.conn.execute("INSERT INTO test (id) VALUES (1);")
+        with db.reader() as conn:
+            assert conn is not db.conn
+            assert conn.execute("SELECT COUNT(*) FROM test;").fetchone()[0] == 0
+        db.conn.commit()
+        with db.reader() as conn:
+            assert conn.execute("SELECT COUNT(*) FROM test;").fetchone()[0] == 1
+            with pytest.raises(sqlite3.OperationalError, match="readonly"):
+                conn.execute("INSERT INTO test (id) VALUES (2);")
+        # Must manually close else we get an error on Windows
+        db.close()
+
+
+def test_reader_queries_share_a_snapshot(logger: Logger):
+    with TemporaryDirectory() as tempdir:
+        db = SqliteDatabase(db_path=Path(tempdir) / "invokeai.db", logger=logger)
+        db.conn.execute("CREATE TABLE test (id INTEGER PRIMARY KEY);")
+        db.conn.commit()
+        with db.reader() as conn:
+            assert conn.execute("SELECT COUNT(*) FROM test;").fetchone()[0] == 0
+            db.conn.execute("INSERT INTO test (id) VALUES (1);")
+            db.conn.commit()
+            assert conn.execute("SELECT COUNT(*) FROM test;").fetchone()[0] == 0
+        with db.reader() as conn:
+            assert conn.execute("SELECT COUNT(*) FROM test;").fetchone()[0] == 1
+        db.close()
+
+
+def test_close_closes_checked_out_readers(logger: Logger):
+    with TemporaryDirectory() as tempdir:
+        db = SqliteDatabase(db_path=Path(tempdir) / "invokeai.db", logger=logger)
+        with pytest.raises(sqlite3.ProgrammingError, match="closed"):
+            with db.reader() as conn:
+                db.close()
+        with pytest.raises(sqlite3.ProgrammingError, match="closed"):
+            conn.execute("SELECT 1;")
@@ -247,7 +247,7 @@ def test_migrator_runs_all_migrations_file(logger: Logger) -> None:
             original_db_cursor = original_db_conn.cursor()
             assert SqliteMigrator._get_current_version(original_db_cursor) == 3
         # Must manually close else we get an error on Windows
-        db.conn.close()
+        db.close()
 
 
 def test_migrator_makes_no_changes_on_failed_migration(
@@ -263,6 +263,19 @@ def test_migrator_makes_no_changes_on_failed_migration(
     assert migrator._get_current_version(cursor) == 1
 
 
+def test_migrator_rolls_back_all_migrations_on_failure(
+    migrator: SqliteMigrator, migration_create_test_table: Migration, failing_migrate_callback: MigrateCallback
+) -> None:
+    cursor = migrator._db.conn.cursor()
+    migrator.register_migration(migration_create_test_table)
+    migrator.register_migration(Migration(from_version=1, to_version=2, callback=failing_migrate_callback))
+    with pytest.raises(MigrationError, match="Bad migration"):
+        migrator.run_migrations()
+    assert migrator._get_current_version(cursor) == 0
+    cursor.execute("SELECT name FROM sqlite_master WHERE type='table' AND name='test';")
+    assert cursor.fetchone() is None
+
+
 def test_idempotent_migrations(migrator: SqliteMigrator, migration_create_test_table: Migration) -> None:
     cursor = migrator._db.conn.cursor()
     migrator.register_migration(migration_create_test_table)